@@ -5,8 +5,11 @@
 //! 1. Deserialize them (accept spec-compliant input)
 //! 2. Re-serialize them and get the same JSON back (produce spec-compliant output)
 //!
-//! The fixtures are generated by: tests/fixtures/generate_golden.py
-//! They are NOT hand-written — they come directly from Python SDK's model_dump().
+//! The fixtures are generated by: tests/fixtures/generate_golden.py and
+//! tests/fixtures/generate_edge_cases.py
+//! They are NOT hand-written — each SDK model is serialized by pydantic via
+//! `TypeAdapter(type(model)).dump_json(model, exclude_none=True)`, then re-encoded
+//! by orjson with sorted keys and 2-space indentation.
 //!
 //! If a test fails, it means the Rust SDK disagrees with the Python SDK on wire format.
 
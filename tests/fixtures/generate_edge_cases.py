@@ -4,12 +4,17 @@
 Tests corner cases, empty collections, nested types, all enum values,
 and every SecurityScheme variant with full detail.
 
-Run: python3 tests/fixtures/generate_edge_cases.py
+Requires: pip install 'a2a-sdk>=0.3,<0.4' orjson
+Run: python3 tests/fixtures/generate_edge_cases.py [--compact] [NAME ...]
 """
 
-import json
+import argparse
+import os
 from pathlib import Path
 
+import orjson
+from pydantic.type_adapter import TypeAdapter
+
 from a2a.types import (
     AgentCapabilities,
     AgentCard,
@@ -50,28 +55,53 @@ from a2a.types import (
 
 OUT_DIR = Path(__file__).parent
 
-
-def dump(name: str, obj):
-    if hasattr(obj, "model_dump"):
-        data = obj.model_dump(mode="json", exclude_none=True)
+_ADAPTERS: dict[type, TypeAdapter] = {}
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+_COMPACT_JSON_OPTIONS = orjson.OPT_SORT_KEYS
+
+
+def model_data(obj):
+    cls = type(obj)
+    adapter = _ADAPTERS.get(cls)
+    if adapter is None:
+        adapter = _ADAPTERS[cls] = TypeAdapter(cls)
+    return orjson.loads(adapter.dump_json(obj, exclude_none=True))
+
+
+def _write(path, payload: bytes) -> bool:
+    try:
+        with open(path, "rb") as f:
+            if f.read() == payload:
+                return False
+    except FileNotFoundError:
+        pass
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
+
+
+def dump(name: str, obj, option: int = _JSON_OPTIONS) -> bool:
+    if hasattr(obj, "model_dump_json"):
+        data = model_data(obj)
     elif isinstance(obj, list):
         data = [
-            item.model_dump(mode="json", exclude_none=True) if hasattr(item, "model_dump") else item
+            model_data(item) if hasattr(item, "model_dump_json") else item
             for item in obj
         ]
     else:
         data = obj
     path = OUT_DIR / f"{name}.json"
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
-    print(f"  {name}.json")
+    return _write(path, orjson.dumps(data, option=option))
 
 
-def main():
-    print("Generating edge-case fixtures...")
-
+FIXTURES = {
     # -- Message with all Part types mixed --
-    dump("message_mixed_parts", Message(
+    "message_mixed_parts": lambda: Message(
         messageId="msg-mixed",
         role="agent",
         parts=[
@@ -81,18 +111,20 @@ def main():
             DataPart(data={"summary": {"total": 100, "passed": 95}}),
         ],
         metadata={"turn": 3},
-    ))
+    ),
 
     # -- Task with all terminal states --
-    for state in [TaskState.completed, TaskState.failed, TaskState.canceled, TaskState.rejected]:
-        dump(f"task_state_{state.value.replace('-', '_')}", Task(
+    **{
+        f"task_state_{state.value.replace('-', '_')}": lambda state=state: Task(
             id=f"task-{state.value}",
             contextId="ctx-states",
             status=TaskStatus(state=state),
-        ))
+        )
+        for state in [TaskState.completed, TaskState.failed, TaskState.canceled, TaskState.rejected]
+    },
 
     # -- Task with input-required (interrupted state) --
-    dump("task_state_input_required", Task(
+    "task_state_input_required": lambda: Task(
         id="task-input-required",
         contextId="ctx-states",
         status=TaskStatus(
@@ -103,26 +135,26 @@ def main():
                 parts=[TextPart(text="Please provide your API key")],
             ),
         ),
-    ))
+    ),
 
     # -- Task with auth-required --
-    dump("task_state_auth_required", Task(
+    "task_state_auth_required": lambda: Task(
         id="task-auth-required",
         contextId="ctx-states",
         status=TaskStatus(state=TaskState.auth_required),
-    ))
+    ),
 
     # -- Task with empty artifacts and history lists --
-    dump("task_empty_collections", Task(
+    "task_empty_collections": lambda: Task(
         id="task-empty",
         contextId="ctx-empty",
         status=TaskStatus(state=TaskState.submitted),
         artifacts=[],
         history=[],
-    ))
+    ),
 
     # -- Task with multiple artifacts --
-    dump("task_multiple_artifacts", Task(
+    "task_multiple_artifacts": lambda: Task(
         id="task-multi-art",
         contextId="ctx-multi",
         status=TaskStatus(state=TaskState.completed),
@@ -141,20 +173,20 @@ def main():
                 metadata={"format": "combined"},
             ),
         ],
-    ))
+    ),
 
     # -- Artifact with file parts --
-    dump("artifact_file_parts", Artifact(
+    "artifact_file_parts": lambda: Artifact(
         artifactId="art-files",
         parts=[
             FilePart(file=FileWithBytes(bytes="cHl0aG9u", mimeType="text/x-python", name="script.py")),
             FilePart(file=FileWithUri(uri="https://cdn.example.com/image.png", mimeType="image/png")),
         ],
         name="code_and_image",
-    ))
+    ),
 
     # -- TaskStatusUpdateEvent with message in status --
-    dump("status_update_with_message", TaskStatusUpdateEvent(
+    "status_update_with_message": lambda: TaskStatusUpdateEvent(
         taskId="t1",
         contextId="c1",
         status=TaskStatus(
@@ -167,10 +199,10 @@ def main():
             timestamp="2024-06-15T14:30:00Z",
         ),
         final=False,
-    ))
+    ),
 
     # -- TaskArtifactUpdateEvent with append --
-    dump("artifact_update_append", TaskArtifactUpdateEvent(
+    "artifact_update_append": lambda: TaskArtifactUpdateEvent(
         taskId="t1",
         contextId="c1",
         artifact=Artifact(
@@ -179,30 +211,30 @@ def main():
         ),
         append=True,
         lastChunk=False,
-    ))
+    ),
 
     # -- SecurityScheme: API key in all locations --
-    dump("security_apikey_query", APIKeySecurityScheme(
+    "security_apikey_query": lambda: APIKeySecurityScheme(
         in_="query",
         name="api_key",
         description="API key passed as query parameter",
-    ))
-    dump("security_apikey_cookie", APIKeySecurityScheme(
+    ),
+    "security_apikey_cookie": lambda: APIKeySecurityScheme(
         in_="cookie",
         name="session_id",
-    ))
+    ),
 
     # -- SecurityScheme: HTTP with various schemes --
-    dump("security_http_basic", HTTPAuthSecurityScheme(
+    "security_http_basic": lambda: HTTPAuthSecurityScheme(
         scheme="basic",
         description="HTTP Basic authentication",
-    ))
-    dump("security_http_bearer_no_format", HTTPAuthSecurityScheme(
+    ),
+    "security_http_bearer_no_format": lambda: HTTPAuthSecurityScheme(
         scheme="bearer",
-    ))
+    ),
 
     # -- SecurityScheme: OAuth2 with client_credentials --
-    dump("security_oauth2_client_creds", OAuth2SecurityScheme(
+    "security_oauth2_client_creds": lambda: OAuth2SecurityScheme(
         flows=OAuthFlows(
             clientCredentials=ClientCredentialsOAuthFlow(
                 tokenUrl="https://auth.example.com/oauth/token",
@@ -210,10 +242,10 @@ def main():
             )
         ),
         description="Service-to-service auth",
-    ))
+    ),
 
     # -- SecurityScheme: OAuth2 with multiple flows --
-    dump("security_oauth2_multi_flow", OAuth2SecurityScheme(
+    "security_oauth2_multi_flow": lambda: OAuth2SecurityScheme(
         flows=OAuthFlows(
             authorizationCode=AuthorizationCodeOAuthFlow(
                 authorizationUrl="https://auth.example.com/authorize",
@@ -227,21 +259,21 @@ def main():
             ),
         ),
         oauth2MetadataUrl="https://auth.example.com/.well-known/oauth-authorization-server",
-    ))
+    ),
 
     # -- SecurityScheme: OpenID Connect --
-    dump("security_openid_with_desc", OpenIdConnectSecurityScheme(
+    "security_openid_with_desc": lambda: OpenIdConnectSecurityScheme(
         openIdConnectUrl="https://accounts.google.com/.well-known/openid-configuration",
         description="Google OIDC",
-    ))
+    ),
 
     # -- SecurityScheme: mTLS with description --
-    dump("security_mtls_with_desc", MutualTLSSecurityScheme(
+    "security_mtls_with_desc": lambda: MutualTLSSecurityScheme(
         description="Client certificate required",
-    ))
+    ),
 
     # -- AgentCard with security schemes --
-    dump("agent_card_with_security", AgentCard(
+    "agent_card_with_security": lambda: AgentCard(
         name="Secure Agent",
         description="An agent with security",
         version="2.0.0",
@@ -264,10 +296,10 @@ def main():
             organization="SecureCorp",
             url="https://securecorp.example.com",
         ),
-    ))
+    ),
 
     # -- AgentCard with extensions --
-    dump("agent_card_with_extensions", AgentCard(
+    "agent_card_with_extensions": lambda: AgentCard(
         name="Extended Agent",
         description="Agent with protocol extensions",
         version="1.0.0",
@@ -295,10 +327,10 @@ def main():
             inputModes=["text/plain", "image/png"],
             outputModes=["application/json"],
         )],
-    ))
+    ),
 
     # -- AgentCard with signatures --
-    dump("agent_card_with_signatures", AgentCard(
+    "agent_card_with_signatures": lambda: AgentCard(
         name="Signed Agent",
         description="Agent with JWS signatures",
         version="1.0.0",
@@ -314,10 +346,10 @@ def main():
                 header={"kid": "key-001"},
             ),
         ],
-    ))
+    ),
 
     # -- PushNotificationConfig with all fields --
-    dump("push_config_full", PushNotificationConfig(
+    "push_config_full": lambda: PushNotificationConfig(
         id="pn-full",
         url="https://hooks.example.com/a2a",
         token="verify-me",
@@ -325,10 +357,10 @@ def main():
             schemes=["Bearer", "Basic"],
             credentials="multi-scheme-token",
         ),
-    ))
+    ),
 
     # -- MessageSendParams with everything --
-    dump("send_params_full", MessageSendParams(
+    "send_params_full": lambda: MessageSendParams(
         message=Message(
             messageId="m-full",
             role="user",
@@ -355,10 +387,10 @@ def main():
             ),
         ),
         metadata={"request_id": "req-123"},
-    ))
+    ),
 
     # -- Data part with nested complex JSON --
-    dump("part_data_complex", DataPart(
+    "part_data_complex": lambda: DataPart(
         data={
             "array": [1, "two", 3.0, True, None, {"nested": "obj"}],
             "nested": {"deep": {"deeper": {"deepest": "value"}}},
@@ -366,16 +398,40 @@ def main():
             "empty_array": [],
         },
         metadata={"schema_version": 2},
-    ))
+    ),
 
     # -- Message with empty parts list (edge case) --
-    dump("message_empty_parts", Message(
+    "message_empty_parts": lambda: Message(
         messageId="msg-empty",
         role="user",
         parts=[],
-    ))
+    ),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate edge-case golden JSON fixtures from the official A2A Python SDK.")
+    parser.add_argument("names", nargs="*", metavar="NAME", help="only regenerate these fixtures (default: all)")
+    parser.add_argument("--compact", action="store_true", help="write compact JSON instead of 2-space indented JSON")
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.names) - FIXTURES.keys())
+    if unknown:
+        parser.error(f"unknown fixture(s): {', '.join(unknown)}")
+    names = args.names or list(FIXTURES)
+    option = _COMPACT_JSON_OPTIONS if args.compact else _JSON_OPTIONS
+
+    print("Generating edge-case fixtures...")
+
+    written = unchanged = 0
+    for name in names:
+        if dump(name, FIXTURES[name](), option):
+            print(f"  {name}.json")
+            written += 1
+        else:
+            print(f"  {name}.json (unchanged)")
+            unchanged += 1
 
-    print(f"\nDone! Generated {len(list(OUT_DIR.glob('*.json')))} total fixture files.")
+    print(f"\nDone! {written} written, {unchanged} unchanged.")
 
 
 if __name__ == "__main__":
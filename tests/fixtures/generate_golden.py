@@ -3,16 +3,22 @@
 
 These fixtures are the GROUND TRUTH for wire format compliance.
 The Rust SDK must deserialize every one of these, and when it
-re-serializes, the output must match byte-for-byte (modulo key order).
+re-serializes, the output must match as JSON (modulo key order and
+whitespace).
 
-Run: python3 tests/fixtures/generate_golden.py
+Requires: pip install 'a2a-sdk>=0.3,<0.4' orjson
+Run: python3 tests/fixtures/generate_golden.py [--compact] [NAME ...]
 Output: tests/fixtures/*.json
 """
 
-import json
+import argparse
+import os
 import sys
 from pathlib import Path
 
+import orjson
+from pydantic.type_adapter import TypeAdapter
+
 # Import from the official A2A Python SDK
 from a2a.types import (
     Artifact,
@@ -52,15 +58,57 @@ from a2a.types import (
 
 OUT_DIR = Path(__file__).parent
 
-
-def dump(name: str, obj):
-    """Serialize a Pydantic model to JSON and write to file."""
-    if hasattr(obj, "model_dump"):
-        data = obj.model_dump(mode="json", exclude_none=True)
+# One TypeAdapter per model class, built on first use and shared by every
+# fixture of that type.
+_ADAPTERS: dict[type, TypeAdapter] = {}
+
+# Matches the historical json.dump(indent=2, sort_keys=True) output. Pass
+# --compact to drop the indentation; the Rust tests compare parsed values.
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+_COMPACT_JSON_OPTIONS = orjson.OPT_SORT_KEYS
+
+
+def model_data(obj):
+    """Serialize a Pydantic model to JSON-compatible data via a cached TypeAdapter."""
+    cls = type(obj)
+    adapter = _ADAPTERS.get(cls)
+    if adapter is None:
+        adapter = _ADAPTERS[cls] = TypeAdapter(cls)
+    return orjson.loads(adapter.dump_json(obj, exclude_none=True))
+
+
+def _write(path, payload: bytes) -> bool:
+    """Write ``payload`` to ``path`` with raw fd writes, bypassing the io stack.
+
+    Returns False without touching the file if it already holds ``payload``.
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read() == payload:
+                return False
+    except FileNotFoundError:
+        pass
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
+
+
+def dump(name: str, obj, option: int = _JSON_OPTIONS) -> bool:
+    """Serialize a Pydantic model to JSON and write to file.
+
+    Returns False if the file was already up to date.
+    """
+    if hasattr(obj, "model_dump_json"):
+        data = model_data(obj)
     elif isinstance(obj, list):
         data = [
-            item.model_dump(mode="json", exclude_none=True)
-            if hasattr(item, "model_dump")
+            model_data(item)
+            if hasattr(item, "model_dump_json")
             else item
             for item in obj
         ]
@@ -68,329 +116,297 @@ def dump(name: str, obj):
         data = obj
 
     path = OUT_DIR / f"{name}.json"
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
-    print(f"  {name}.json")
+    return _write(path, orjson.dumps(data, option=option))
 
 
-def main():
-    print("Generating golden fixtures from A2A Python SDK...")
-
+# Registry of fixture name -> factory. Factories defer model construction so
+# that only the fixtures being regenerated are built.
+FIXTURES = {
     # -- TaskState enum values --
-    dump("task_state_all", [s.value for s in TaskState])
+    "task_state_all": lambda: [s.value for s in TaskState],
 
     # -- TextPart --
-    dump("part_text", TextPart(text="Hello, world!"))
-    dump("part_text_with_metadata", TextPart(text="Hello", metadata={"source": "test"}))
+    "part_text": lambda: TextPart(text="Hello, world!"),
+    "part_text_with_metadata": lambda: TextPart(
+        text="Hello", metadata={"source": "test"}
+    ),
 
     # -- FilePart with bytes --
-    dump(
-        "part_file_bytes",
-        FilePart(
-            file=FileWithBytes(
-                bytes="SGVsbG8gV29ybGQ=",
-                mimeType="text/plain",
-                name="hello.txt",
-            )
-        ),
-    )
+    "part_file_bytes": lambda: FilePart(
+        file=FileWithBytes(
+            bytes="SGVsbG8gV29ybGQ=",
+            mimeType="text/plain",
+            name="hello.txt",
+        )
+    ),
 
     # -- FilePart with URI --
-    dump(
-        "part_file_uri",
-        FilePart(
-            file=FileWithUri(
-                uri="https://example.com/doc.pdf",
-                mimeType="application/pdf",
-            )
-        ),
-    )
+    "part_file_uri": lambda: FilePart(
+        file=FileWithUri(
+            uri="https://example.com/doc.pdf",
+            mimeType="application/pdf",
+        )
+    ),
 
     # -- DataPart --
-    dump("part_data", DataPart(data={"key": "value", "count": 42}))
-    dump(
-        "part_data_with_metadata",
-        DataPart(data={"items": [1, 2, 3]}, metadata={"schema": "v1"}),
-    )
+    "part_data": lambda: DataPart(data={"key": "value", "count": 42}),
+    "part_data_with_metadata": lambda: DataPart(
+        data={"items": [1, 2, 3]}, metadata={"schema": "v1"}
+    ),
 
     # -- Message (minimal) --
-    dump(
-        "message_minimal",
-        Message(
-            messageId="msg-001",
-            role="user",
-            parts=[TextPart(text="Hello agent")],
-        ),
-    )
+    "message_minimal": lambda: Message(
+        messageId="msg-001",
+        role="user",
+        parts=[TextPart(text="Hello agent")],
+    ),
 
     # -- Message (full) --
-    dump(
-        "message_full",
-        Message(
-            messageId="msg-002",
-            role="agent",
-            parts=[TextPart(text="Response")],
-            contextId="ctx-1",
-            taskId="task-1",
-            metadata={"model": "gpt-4"},
-            extensions=["urn:a2a:ext:streaming"],
-            referenceTaskIds=["task-0"],
-        ),
-    )
+    "message_full": lambda: Message(
+        messageId="msg-002",
+        role="agent",
+        parts=[TextPart(text="Response")],
+        contextId="ctx-1",
+        taskId="task-1",
+        metadata={"model": "gpt-4"},
+        extensions=["urn:a2a:ext:streaming"],
+        referenceTaskIds=["task-0"],
+    ),
 
     # -- TaskStatus --
-    dump("task_status_minimal", TaskStatus(state=TaskState.working))
-    dump(
-        "task_status_full",
-        TaskStatus(
-            state=TaskState.completed,
-            message=Message(
-                messageId="m1",
-                role="agent",
-                parts=[TextPart(text="Done!")],
-            ),
-            timestamp="2024-01-15T10:30:00Z",
+    "task_status_minimal": lambda: TaskStatus(state=TaskState.working),
+    "task_status_full": lambda: TaskStatus(
+        state=TaskState.completed,
+        message=Message(
+            messageId="m1",
+            role="agent",
+            parts=[TextPart(text="Done!")],
         ),
-    )
+        timestamp="2024-01-15T10:30:00Z",
+    ),
 
     # -- Task (minimal) --
-    dump(
-        "task_minimal",
-        Task(
-            id="task-001",
-            contextId="ctx-001",
-            status=TaskStatus(state=TaskState.submitted),
-        ),
-    )
+    "task_minimal": lambda: Task(
+        id="task-001",
+        contextId="ctx-001",
+        status=TaskStatus(state=TaskState.submitted),
+    ),
 
     # -- Task (full) --
-    dump(
-        "task_full",
-        Task(
-            id="task-002",
-            contextId="ctx-002",
-            status=TaskStatus(
-                state=TaskState.completed,
-                timestamp="2024-01-15T12:00:00Z",
-            ),
-            artifacts=[
-                Artifact(
-                    artifactId="art-1",
-                    parts=[TextPart(text="Result data")],
-                    name="output",
-                    description="The output artifact",
-                )
-            ],
-            history=[
-                Message(
-                    messageId="m1",
-                    role="user",
-                    parts=[TextPart(text="Do something")],
-                )
-            ],
-            metadata={"priority": "high"},
+    "task_full": lambda: Task(
+        id="task-002",
+        contextId="ctx-002",
+        status=TaskStatus(
+            state=TaskState.completed,
+            timestamp="2024-01-15T12:00:00Z",
         ),
-    )
+        artifacts=[
+            Artifact(
+                artifactId="art-1",
+                parts=[TextPart(text="Result data")],
+                name="output",
+                description="The output artifact",
+            )
+        ],
+        history=[
+            Message(
+                messageId="m1",
+                role="user",
+                parts=[TextPart(text="Do something")],
+            )
+        ],
+        metadata={"priority": "high"},
+    ),
 
     # -- Artifact --
-    dump(
-        "artifact",
-        Artifact(
-            artifactId="art-001",
-            name="code_output",
-            description="Generated code",
-            parts=[
-                TextPart(text="fn main() {}"),
-                DataPart(data={"language": "rust"}),
-            ],
-            extensions=["urn:a2a:ext:code"],
-        ),
-    )
+    "artifact": lambda: Artifact(
+        artifactId="art-001",
+        name="code_output",
+        description="Generated code",
+        parts=[
+            TextPart(text="fn main() {}"),
+            DataPart(data={"language": "rust"}),
+        ],
+        extensions=["urn:a2a:ext:code"],
+    ),
 
     # -- TaskStatusUpdateEvent --
-    dump(
-        "task_status_update_event",
-        TaskStatusUpdateEvent(
-            taskId="task-001",
-            contextId="ctx-001",
-            status=TaskStatus(state=TaskState.working),
-            final=False,
-        ),
-    )
-    dump(
-        "task_status_update_event_final",
-        TaskStatusUpdateEvent(
-            taskId="task-002",
-            contextId="ctx-002",
-            status=TaskStatus(state=TaskState.completed),
-            final=True,
-        ),
-    )
+    "task_status_update_event": lambda: TaskStatusUpdateEvent(
+        taskId="task-001",
+        contextId="ctx-001",
+        status=TaskStatus(state=TaskState.working),
+        final=False,
+    ),
+    "task_status_update_event_final": lambda: TaskStatusUpdateEvent(
+        taskId="task-002",
+        contextId="ctx-002",
+        status=TaskStatus(state=TaskState.completed),
+        final=True,
+    ),
 
     # -- TaskArtifactUpdateEvent --
-    dump(
-        "task_artifact_update_event",
-        TaskArtifactUpdateEvent(
-            taskId="task-001",
-            contextId="ctx-001",
-            artifact=Artifact(
-                artifactId="art-1",
-                parts=[TextPart(text="chunk 1")],
-            ),
-            append=False,
-            lastChunk=True,
+    "task_artifact_update_event": lambda: TaskArtifactUpdateEvent(
+        taskId="task-001",
+        contextId="ctx-001",
+        artifact=Artifact(
+            artifactId="art-1",
+            parts=[TextPart(text="chunk 1")],
         ),
-    )
+        append=False,
+        lastChunk=True,
+    ),
 
     # -- SecurityScheme variants --
-    dump(
-        "security_scheme_apikey",
-        APIKeySecurityScheme(in_="header", name="X-API-Key"),
-    )
-    dump(
-        "security_scheme_http",
-        HTTPAuthSecurityScheme(scheme="bearer", bearerFormat="JWT"),
-    )
-    dump(
-        "security_scheme_oauth2",
-        OAuth2SecurityScheme(
-            flows=OAuthFlows(
-                authorizationCode=AuthorizationCodeOAuthFlow(
-                    authorizationUrl="https://auth.example.com/authorize",
-                    tokenUrl="https://auth.example.com/token",
-                    scopes={"read": "Read access", "write": "Write access"},
-                )
+    "security_scheme_apikey": lambda: APIKeySecurityScheme(
+        in_="header", name="X-API-Key"
+    ),
+    "security_scheme_http": lambda: HTTPAuthSecurityScheme(
+        scheme="bearer", bearerFormat="JWT"
+    ),
+    "security_scheme_oauth2": lambda: OAuth2SecurityScheme(
+        flows=OAuthFlows(
+            authorizationCode=AuthorizationCodeOAuthFlow(
+                authorizationUrl="https://auth.example.com/authorize",
+                tokenUrl="https://auth.example.com/token",
+                scopes={"read": "Read access", "write": "Write access"},
             )
-        ),
-    )
-    dump(
-        "security_scheme_openid",
-        OpenIdConnectSecurityScheme(
-            openIdConnectUrl="https://auth.example.com/.well-known/openid-configuration"
-        ),
-    )
-    dump("security_scheme_mtls", MutualTLSSecurityScheme())
+        )
+    ),
+    "security_scheme_openid": lambda: OpenIdConnectSecurityScheme(
+        openIdConnectUrl="https://auth.example.com/.well-known/openid-configuration"
+    ),
+    "security_scheme_mtls": lambda: MutualTLSSecurityScheme(),
 
     # -- AgentInterface --
-    dump(
-        "agent_interface",
-        AgentInterface(
-            url="https://api.example.com/a2a",
-            transport="JSONRPC",
-        ),
-    )
-    dump(
-        "agent_interface_with_version",
-        AgentInterface(
-            url="https://grpc.example.com/a2a",
-            transport="GRPC",
-            protocolVersion="0.3",
-        ),
-    )
+    "agent_interface": lambda: AgentInterface(
+        url="https://api.example.com/a2a",
+        transport="JSONRPC",
+    ),
+    "agent_interface_with_version": lambda: AgentInterface(
+        url="https://grpc.example.com/a2a",
+        transport="GRPC",
+        protocolVersion="0.3",
+    ),
 
     # -- AgentCapabilities --
-    dump("agent_capabilities_empty", AgentCapabilities())
-    dump(
-        "agent_capabilities_full",
-        AgentCapabilities(
-            streaming=True,
-            pushNotifications=False,
-            stateTransitionHistory=True,
-        ),
-    )
+    "agent_capabilities_empty": lambda: AgentCapabilities(),
+    "agent_capabilities_full": lambda: AgentCapabilities(
+        streaming=True,
+        pushNotifications=False,
+        stateTransitionHistory=True,
+    ),
 
     # -- AgentSkill --
-    dump(
-        "agent_skill",
-        AgentSkill(
-            id="code-gen",
-            name="Code Generation",
-            description="Generates code in various languages",
-            tags=["coding", "generation"],
-            examples=["Write a function", "Generate a class"],
-            inputModes=["text/plain"],
-            outputModes=["text/plain", "application/json"],
-        ),
-    )
+    "agent_skill": lambda: AgentSkill(
+        id="code-gen",
+        name="Code Generation",
+        description="Generates code in various languages",
+        tags=["coding", "generation"],
+        examples=["Write a function", "Generate a class"],
+        inputModes=["text/plain"],
+        outputModes=["text/plain", "application/json"],
+    ),
 
     # -- AgentProvider --
-    dump(
-        "agent_provider",
-        AgentProvider(organization="Acme Corp", url="https://acme.example.com"),
-    )
+    "agent_provider": lambda: AgentProvider(
+        organization="Acme Corp", url="https://acme.example.com"
+    ),
 
     # -- PushNotificationConfig --
-    dump(
-        "push_notification_config",
-        PushNotificationConfig(
-            id="pn-1",
-            url="https://hooks.example.com/notify",
-            token="verify-token-123",
-            authentication=PushNotificationAuthenticationInfo(
-                schemes=["Bearer"],
-                credentials="secret-token",
-            ),
+    "push_notification_config": lambda: PushNotificationConfig(
+        id="pn-1",
+        url="https://hooks.example.com/notify",
+        token="verify-token-123",
+        authentication=PushNotificationAuthenticationInfo(
+            schemes=["Bearer"],
+            credentials="secret-token",
         ),
-    )
+    ),
 
     # -- TaskPushNotificationConfig --
-    dump(
-        "task_push_notification_config",
-        TaskPushNotificationConfig(
-            id="tpnc-1",
-            taskId="task-001",
-            pushNotificationConfig=PushNotificationConfig(
-                url="https://hooks.example.com/notify",
-            ),
+    "task_push_notification_config": lambda: TaskPushNotificationConfig(
+        id="tpnc-1",
+        taskId="task-001",
+        pushNotificationConfig=PushNotificationConfig(
+            url="https://hooks.example.com/notify",
         ),
-    )
+    ),
 
     # -- MessageSendParams --
-    dump(
-        "send_message_params",
-        MessageSendParams(
-            message=Message(
-                messageId="m1",
-                role="user",
-                parts=[TextPart(text="Hello")],
-            ),
-            configuration=MessageSendConfiguration(
-                acceptedOutputModes=["text/plain", "application/json"],
-                historyLength=10,
-                blocking=True,
-            ),
+    "send_message_params": lambda: MessageSendParams(
+        message=Message(
+            messageId="m1",
+            role="user",
+            parts=[TextPart(text="Hello")],
         ),
-    )
+        configuration=MessageSendConfiguration(
+            acceptedOutputModes=["text/plain", "application/json"],
+            historyLength=10,
+            blocking=True,
+        ),
+    ),
 
     # -- AgentCard (minimal) --
-    dump(
-        "agent_card_minimal",
-        AgentCard(
-            name="Test Agent",
-            description="A test agent",
-            version="1.0.0",
-            url="https://agent.example.com",
-            supportedInterfaces=[
-                AgentInterface(
-                    url="https://agent.example.com/a2a",
-                    transport="JSONRPC",
-                )
-            ],
-            capabilities=AgentCapabilities(),
-            defaultInputModes=["text/plain"],
-            defaultOutputModes=["text/plain"],
-            skills=[
-                AgentSkill(
-                    id="echo",
-                    name="Echo",
-                    description="Echoes input",
-                    tags=["utility"],
-                )
-            ],
-        ),
+    "agent_card_minimal": lambda: AgentCard(
+        name="Test Agent",
+        description="A test agent",
+        version="1.0.0",
+        url="https://agent.example.com",
+        supportedInterfaces=[
+            AgentInterface(
+                url="https://agent.example.com/a2a",
+                transport="JSONRPC",
+            )
+        ],
+        capabilities=AgentCapabilities(),
+        defaultInputModes=["text/plain"],
+        defaultOutputModes=["text/plain"],
+        skills=[
+            AgentSkill(
+                id="echo",
+                name="Echo",
+                description="Echoes input",
+                tags=["utility"],
+            )
+        ],
+    ),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate golden JSON fixtures from the official A2A Python SDK."
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        metavar="NAME",
+        help="only regenerate these fixtures (default: all)",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="write compact JSON instead of 2-space indented JSON",
+    )
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.names) - FIXTURES.keys())
+    if unknown:
+        parser.error(f"unknown fixture(s): {', '.join(unknown)}")
+    names = args.names or list(FIXTURES)
+    option = _COMPACT_JSON_OPTIONS if args.compact else _JSON_OPTIONS
+
+    print("Generating golden fixtures from A2A Python SDK...")
+
+    written = unchanged = 0
+    for name in names:
+        if dump(name, FIXTURES[name](), option):
+            print(f"  {name}.json")
+            written += 1
+        else:
+            print(f"  {name}.json (unchanged)")
+            unchanged += 1
 
-    print(f"\nDone! Generated {len(list(OUT_DIR.glob('*.json')))} fixture files.")
+    print(f"\nDone! {written} written, {unchanged} unchanged.")
 
 
 if __name__ == "__main__":